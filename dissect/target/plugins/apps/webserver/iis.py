@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import csv
+import re
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, BinaryIO
+
+from defusedxml import ElementTree
+from flow.record.base import RE_VALID_FIELD_NAME
+
+try:
+    from lxml import etree
+
+    HAS_LXML = True
+
+except ImportError:
+    HAS_LXML = False
+
+from dissect.target.exceptions import FileNotFoundError, UnsupportedPluginError
+from dissect.target.helpers.fsutil import has_glob_magic
+from dissect.target.helpers.record import TargetRecordDescriptor
+from dissect.target.plugin import export
+from dissect.target.plugins.apps.webserver.webserver import (
+    WebserverAccessLogRecord,
+    WebserverPlugin,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from dissect.target.target import Target
+
+
+XML_PARSE_ERRORS = (ElementTree.ParseError, etree.XMLSyntaxError) if HAS_LXML else (ElementTree.ParseError,)
+
+LOG_RECORD_NAME = "application/webserver/iis/log"
+
+BASIC_RECORD_FIELDS = [
+    ("datetime", "ts"),
+    ("net.ipaddress", "client_ip"),
+    ("net.ipaddress", "server_ip"),
+    ("string", "username"),
+    ("string", "server_name"),
+    ("string", "site_name"),
+    ("string", "request_method"),
+    ("string", "request_path"),
+    ("string", "request_query"),
+    ("string", "request_size_bytes"),
+    ("string", "response_size_bytes"),
+    ("string", "process_time_ms"),
+    # https://docs.microsoft.com/en-US/troubleshoot/iis/http-status-code
+    ("string", "service_status_code"),
+    # https://docs.microsoft.com/en-us/windows/win32/debug/system-error-codes?redirectedfrom=MSDN#system-error-codes-1
+    ("string", "win32_status_code"),
+    ("string", "format"),
+    ("path", "source"),
+]
+BasicRecordDescriptor = TargetRecordDescriptor(LOG_RECORD_NAME, BASIC_RECORD_FIELDS)
+
+# Maps the basic W3C field names to their BasicRecordDescriptor counterparts.
+W3C_FIELD_MAP = {
+    "c-ip": "client_ip",
+    "s-ip": "server_ip",
+    "cs-username": "username",
+    "s-computername": "server_name",
+    "s-sitename": "site_name",
+    "cs-method": "request_method",
+    "cs-uri-stem": "request_path",
+    "cs-uri-query": "request_query",
+    "cs-bytes": "request_size_bytes",
+    "sc-bytes": "response_size_bytes",
+    "time-taken": "process_time_ms",
+    "sc-status": "service_status_code",
+    "sc-win32-status": "win32_status_code",
+}
+
+# Simplified reverse of flow.record.base.RE_VALID_FIELD_NAME
+FIELD_NAME_INVALID_CHARS_RE = re.compile(r"[^a-zA-Z0-9]")
+
+# Translation table mapping every invalid ASCII character to "_", used as a faster
+# equivalent of FIELD_NAME_INVALID_CHARS_RE for the common all-ASCII case.
+FIELD_NAME_TRANSLATION_TABLE = str.maketrans(
+    {char: "_" for char in map(chr, range(128)) if FIELD_NAME_INVALID_CHARS_RE.match(char)}
+)
+
+
+@lru_cache(4096)
+def _create_extended_descriptor(extra_fields: tuple[tuple[str, str]]) -> TargetRecordDescriptor:
+    return TargetRecordDescriptor(LOG_RECORD_NAME, BASIC_RECORD_FIELDS + list(extra_fields))
+
+
+class IISLogsPlugin(WebserverPlugin):
+    """IIS 7 (and above) logs plugin.
+
+    References:
+        - https://docs.microsoft.com/en-us/iis/get-started/planning-your-iis-architecture/introduction-to-applicationhostconfig
+        - https://docs.microsoft.com/en-us/previous-versions/iis/6.0-sdk/ms525807%28v=vs.90%29
+    """
+
+    APPLICATION_HOST_CONFIG = "%windir%/system32/inetsrv/config/applicationHost.config"
+
+    DEFAULT_LOG_DIRS = (
+        "%windir%\\System32\\LogFiles\\W3SVC*",
+        "sysvol\\Windows.old\\Windows\\System32\\LogFiles\\W3SVC*",
+        "sysvol\\inetpub\\logs\\LogFiles",
+        "sysvol\\Resources\\Directory\\*\\LogFiles\\Web\\W3SVC*",
+    )
+
+    __namespace__ = "iis"
+
+    def __init__(self, target: Target):
+        super().__init__(target)
+        self.config = self.target.resolve(self.APPLICATION_HOST_CONFIG)
+
+    def check_compatible(self) -> None:
+        if not any(self.log_dirs.values()):
+            raise UnsupportedPluginError("No IIS log files found")
+
+    @cached_property
+    def log_dirs(self) -> dict[str, set[Path]]:
+        dirs = {"auto": set(), "W3C": set(), "IIS": set()}
+
+        if (sysvol_files := self.target.fs.path("sysvol/files")).exists():
+            dirs["auto"].add(sysvol_files)
+
+        if self.config.exists():
+            self._read_config_log_paths(dirs)
+
+        for log_dir in self.DEFAULT_LOG_DIRS:
+            log_dir = self.target.fs.path(self.target.expand_env(log_dir))
+
+            # Plain paths only need a single exists() check, globbing the filesystem for
+            # them as well would cost another round of metadata operations.
+            if not has_glob_magic(log_dir_str := str(log_dir)):
+                if log_dir.exists():
+                    dirs["auto"].add(log_dir)
+                continue
+
+            for _log_dir_str in self.target.fs.glob(log_dir_str):
+                if not (_log_dir := self.target.fs.path(_log_dir_str)).is_dir():
+                    continue
+                dirs["auto"].add(_log_dir)
+
+        return dirs
+
+    def _get_paths(self) -> Iterator[Path]:
+        for path in self.log_dirs.values():
+            yield from path
+
+    def _get_auxiliary_paths(self) -> Iterator[Path]:
+        yield from {self.config}
+
+    def _read_config_log_paths(self, dirs: dict[str, set[str]]) -> None:
+        try:
+            # Stream the configuration with iterparse instead of materializing the whole tree,
+            # only the few <logFile> elements under */sites/* are of interest.
+            with self.config.open() as fh:
+                if HAS_LXML:
+                    # The libxml2 backend parses considerably faster. Entity resolution and network
+                    # access are disabled to match the defusedxml hardening.
+                    events = etree.iterparse(fh, events=("start", "end"), resolve_entities=False, no_network=True)
+                else:
+                    events = ElementTree.iterparse(fh, events=("start", "end"), forbid_dtd=True)
+
+                stack = []
+                for event, element in events:
+                    if event == "start":
+                        stack.append(element.tag)
+                        continue
+
+                    stack.pop()
+
+                    # Equivalent of findall("*/sites/*/logFile") on the full tree.
+                    if element.tag == "logFile" and len(stack) == 4 and stack[2] == "sites":
+                        log_format = element.get("logFormat") or "W3C"
+                        if log_dir := element.get("directory"):
+                            if log_format not in dirs:
+                                self.target.log.warning("Unsupported log format %s, skipping %s", log_format, log_dir)
+                                continue
+                            dirs[log_format].add(self.target.resolve(log_dir))
+
+                    # Drop each completed subtree below the root to bound memory usage.
+                    if len(stack) == 1:
+                        element.clear()
+
+        except (*XML_PARSE_ERRORS, FileNotFoundError) as e:
+            self.target.log.warning("Error while parsing %s", self.config)
+            self.target.log.debug("", exc_info=e)
+
+    @export(record=BasicRecordDescriptor)
+    def logs(self) -> Iterator[TargetRecordDescriptor]:
+        """Return contents of IIS (v7 and above) log files.
+
+        Internet Information Services (IIS) for Windows Server is a manageable web server for hosting anything on the
+        web. Logs files might, for example, contain traces that indicate that the web server has been exploited.
+
+        Supported log formats: IIS, W3C.
+        """
+        # We handle direct files here because _get_paths cannot select (filter) on the type of logfile.
+        if self.target.is_direct:
+            for log_file in self.get_paths():
+                yield from parse_autodetect_format_log(self.target, log_file)
+            # If we use the direct loader, there are no other files available.
+            return
+
+        parsers = {
+            "W3C": parse_w3c_format_log,
+            "IIS": parse_iis_format_log,
+            "auto": parse_autodetect_format_log,
+        }
+
+        for format, parser in parsers.items():
+            for log_dir in self.log_dirs.get(format, ()):
+                for log_file in log_dir.rglob("*.log"):
+                    self.target.log.info("Processing IIS log file %s in %s format", log_file, format)
+                    try:
+                        yield from parser(self.target, log_file)
+                    except Exception as e:
+                        self.target.log.error("Issue processing log file %s in %s format", log_file, format)  # noqa TRY400
+                        self.target.log.debug("", exc_info=e)
+
+    @export(record=WebserverAccessLogRecord)
+    def access(self) -> Iterator[WebserverAccessLogRecord]:
+        """Return contents of IIS (v7 and above) log files in unified WebserverAccessLogRecord format.
+
+        See function ``iis.logs`` for more information and more verbose IIS records.
+        """
+        for iis_record in self.logs():
+            yield WebserverAccessLogRecord(
+                ts=iis_record.ts,
+                webserver="iis",
+                remote_user=iis_record.username,
+                remote_ip=iis_record.client_ip,
+                method=iis_record.request_method,
+                uri=iis_record.request_path,
+                query=getattr(iis_record, "request_query", None),
+                protocol=getattr(iis_record, "cs_version", None),
+                status_code=getattr(iis_record, "service_status_code", None),
+                bytes_sent=iis_record.response_size_bytes,
+                referer=getattr(iis_record, "cs_referer", None),
+                useragent=getattr(iis_record, "cs_user_agent", None),
+                source=iis_record.source,
+                _target=self.target,
+            )
+
+
+def parse_autodetect_format_log(target: Target, path: Path) -> Iterator[BasicRecordDescriptor]:
+    # Sniff the format from the first byte and hand the open file to the parser, re-opening
+    # the file is expensive on virtual dissect filesystems.
+    with path.open() as fh:
+        is_w3c = fh.read(1) == b"#"
+        fh.seek(0)
+
+        parser = parse_w3c_format_log if is_w3c else parse_iis_format_log
+        yield from parser(target, path, fh)
+
+
+def parse_w3c_format_log(target: Target, path: Path, fh: BinaryIO | None = None) -> Iterator[TargetRecordDescriptor]:
+    """Parse log file in W3C format and yield log records.
+
+    This is the default logging format for IIS [^3].
+
+    References:
+        - https://docs.microsoft.com/en-us/previous-versions/iis/6.0-sdk/ms525807%28v=vs.90%29#w3c-extended-log-file-format
+        - https://docs.microsoft.com/en-us/previous-versions/windows/it-pro/windows-server-2003/cc786596%28v=ws.10%29
+        - https://learn.microsoft.com/en-us/iis/configuration/system.applicationHost/sites/site/logFile
+    """
+    record_descriptor = None
+    fields = []
+    field_slots = []
+    date_idx = time_idx = None
+    if fh is None:
+        fh = path.open()
+
+    with fh:
+        for raw_line in fh:
+            # Check the comment marker on the raw bytes so plain comment lines skip the decode entirely,
+            # only the #Fields header needs to be parsed.
+            if raw_line.startswith(b"#"):
+                if not raw_line.startswith(b"#Fields"):
+                    continue
+
+                line = raw_line.decode("utf-8", errors="backslashreplace").strip()
+                _, _, fields_str = line.partition("Fields: ")
+                fields = fields_str.split()
+                # Resolve each field to its record field name and value index once per header, so
+                # log lines can be mapped straight to record kwargs without an intermediate dict.
+                extra_fields = sorted(set(fields) - set(W3C_FIELD_MAP))
+                extra_fields_with_types = [("string", normalise_field_name(f)) for f in extra_fields]
+                record_descriptor = _create_extended_descriptor(tuple(extra_fields_with_types))
+                field_slots = [(W3C_FIELD_MAP.get(f) or normalise_field_name(f), i) for i, f in enumerate(fields)]
+                date_idx = fields.index("date") if "date" in fields else None
+                time_idx = fields.index("time") if "time" in fields else None
+                continue
+
+            line = raw_line.decode("utf-8", errors="backslashreplace").strip()
+            values = line.split()
+
+            if len(values) != len(fields):
+                target.log.warning("Log values do not match fields defined, skipping: %r", line)
+                continue
+
+            if not record_descriptor:
+                target.log.warning(
+                    "Comment line with the fields defined should come before the values, skipping: %r", line
+                )
+                continue
+
+            # Map the value slots straight to record kwargs, replacing the "-" placeholders
+            # along the way.
+            kwargs = {name: None if (value := values[idx]) == "-" else value for name, idx in field_slots}
+
+            # Make the datetime timezone aware.
+            # "the time stamp for each W3C Extended Logging log record is UTC-based." [^3]
+            ts = None
+            if date_idx is not None and time_idx is not None:
+                date_value = values[date_idx]
+                time_value = values[time_idx]
+                if date_value != "-" and time_value != "-":
+                    # The W3C date/time format is ISO 8601, so use the much faster C parser of fromisoformat
+                    # instead of strptime.
+                    ts = datetime.fromisoformat(f"{date_value} {time_value}").replace(tzinfo=timezone.utc)
+
+            yield record_descriptor(
+                ts=ts,
+                format="W3C",
+                source=path,
+                _target=target,
+                **kwargs,
+            )
+
+
+def parse_iis_format_log(target: Target, path: Path, fh: BinaryIO | None = None) -> Iterator[BasicRecordDescriptor]:
+    """Parse log file in IIS format and stream log records.
+
+    This format is not the default IIS log format.
+
+    References:
+        - https://docs.microsoft.com/en-us/previous-versions/iis/6.0-sdk/ms525807%28v=vs.90%29#iis-log-file-format
+        - https://docs.microsoft.com/en-us/previous-versions/windows/it-pro/windows-server-2003/cc728311%28v=ws.10%29
+        - https://learn.microsoft.com/en-us/iis/configuration/system.applicationHost/sites/site/logFile
+    """
+    target_tz = target.datetime.tzinfo
+
+    if fh is None:
+        fh = path.open()
+
+    with fh:
+        # even though the docs say that IIS log format is ASCII format,
+        # it is possible to select UTF-8 in configuration
+        lines = (line.decode("utf-8", errors="backslashreplace") for line in fh)
+
+        # csv.reader splits and strips the ", " separators in a single C-level pass.
+        # QUOTE_NONE matches the old str.split behaviour for values containing quotes.
+        for parts in csv.reader(lines, skipinitialspace=True, quoting=csv.QUOTE_NONE):
+            # Example:
+            # 127.0.0.1, -, 9/20/2021, 8:51:21, W3SVC1, DESKTOP-PJOQLJS, 127.0.0.1, 0, 691, 5005, 404, 2, GET, /some, -,
+            if len(parts) != 16:
+                target.log.debug("Unrecognised log line format, skipping: %r", parts)
+                continue
+
+            # The column order is fixed, so replace the "-" placeholders on explicit kwargs
+            # instead of building a row dict and rebuilding it with the placeholders swapped.
+            yield BasicRecordDescriptor(
+                client_ip=_none_if_dash(parts[0]),
+                username=_none_if_dash(parts[1]),
+                ts=parse_iis_datetime(parts[2], parts[3], target_tz),
+                site_name=_none_if_dash(parts[4]),
+                server_name=_none_if_dash(parts[5]),
+                server_ip=_none_if_dash(parts[6]),
+                process_time_ms=_none_if_dash(parts[7]),
+                request_size_bytes=_none_if_dash(parts[8]),
+                response_size_bytes=_none_if_dash(parts[9]),
+                service_status_code=_none_if_dash(parts[10]),
+                win32_status_code=_none_if_dash(parts[11]),
+                request_method=_none_if_dash(parts[12]),
+                request_path=_none_if_dash(parts[13]),
+                request_query=_none_if_dash(parts[14]),
+                format="IIS",
+                source=path,
+                _target=target,
+            )
+
+
+def parse_iis_datetime(date_str: str, time_str: str, tzinfo: timezone) -> datetime:
+    # Example: 10/1/2021 7:19:59
+    # "time is recorded as local time." [^3]
+    # Constructing the datetime directly is considerably faster than strptime.
+    month, day, year = date_str.split("/")
+    hour, minute, second = time_str.split(":")
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), tzinfo=tzinfo)
+
+
+def _none_if_dash(value: str) -> str | None:
+    """Return ``None`` for the ``-`` placeholder, the value itself otherwise."""
+    return None if value == "-" else value
+
+
+@lru_cache(maxsize=1024)
+def normalise_field_name(field: str) -> str:
+    """Replace all character that are not allowed in the field name by flow.record
+    with _, and strip all hanging _ from start / end of the string.
+    """
+    if RE_VALID_FIELD_NAME.match(field):
+        return field
+
+    if field.isascii():
+        return field.translate(FIELD_NAME_TRANSLATION_TABLE).strip("_").lower()
+
+    return FIELD_NAME_INVALID_CHARS_RE.sub("_", field).strip("_").lower()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import io
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from dissect.target.exceptions import UnsupportedPluginError
+from dissect.target.helpers.record import TargetRecordDescriptor
+from dissect.target.plugin import Plugin, export
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from dissect.target.target import Target
+
+COMMON_ELEMENTS = [
+    ("datetime", "start_time"),
+    ("datetime", "stop_time"),
+    ("datetime", "created"),
+    ("datetime", "modified"),
+    ("datetime", "access"),
+    ("path", "path"),
+    ("path", "filename"),
+    ("path", "create"),
+    ("varint", "size"),
+    ("string", "magic"),
+    ("string", "size_of_image"),
+    ("varint", "pe_checksum"),
+    ("datetime", "link_date"),
+    ("string", "linker_version"),
+    ("string", "bin_file_version"),
+    ("string", "bin_product_version"),
+    ("string", "binary_type"),
+    ("digest", "digest"),
+    ("wstring", "file_version"),
+    ("wstring", "company_name"),
+    ("wstring", "file_description"),
+    ("wstring", "legal"),
+    ("string", "original_filename"),
+    ("wstring", "product_name"),
+    ("string", "product_version"),
+    ("string", "pe_image"),
+    ("string", "pe_subsystem"),
+    ("string", "crc_checksum"),
+    ("filesize", "filesize"),
+    ("wstring", "longname"),
+    ("string", "msi"),
+]
+
+AmcacheFileCreateRecord = TargetRecordDescriptor(
+    "filesystem/windows/amcache/install/file_create",
+    COMMON_ELEMENTS,
+)
+
+AmcacheArpCreateRecord = TargetRecordDescriptor(
+    "filesystem/windows/amcache/install/arp_create",
+    COMMON_ELEMENTS,
+)
+
+
+def _to_log_timestamp(timestamp: str | None) -> datetime | None:
+    if not timestamp:
+        return None
+
+    # Example: 10/1/2021 7:19:59
+    # Constructing the datetime directly is considerably faster than strptime.
+    date_str, _, time_str = timestamp.partition(" ")
+    month, day, year = date_str.split("/")
+    hour, minute, second = time_str.split(":")
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc)
+
+
+def create_base_kwargs(install_properties: dict[str, str]) -> dict[str, Any]:
+    """Build the record kwargs that are shared by every record emitted for one install log."""
+    return {
+        "start_time": _to_log_timestamp(install_properties.get("starttime")),
+        "stop_time": _to_log_timestamp(install_properties.get("stoptime")),
+        "created": _to_log_timestamp(install_properties.get("created")),
+        "modified": _to_log_timestamp(install_properties.get("modified")),
+        "access": _to_log_timestamp(install_properties.get("lastaccessed")),
+        "link_date": _to_log_timestamp(install_properties.get("linkdate")),
+        "size_of_image": install_properties.get("sizeofimage"),
+        "file_description": install_properties.get("filedescription"),
+        "size": int(install_properties.get("size", "0x00"), 16),
+        # Remove the leading zeros from the entry to create a sha1 hash.
+        "digest": (None, entry_id[4:], None) if (entry_id := install_properties.get("id")) else None,
+        "company_name": install_properties.get("companyname"),
+        "binary_type": install_properties.get("binarytype"),
+        "bin_product_version": install_properties.get("binproductversion"),
+        "bin_file_version": install_properties.get("binfileversion"),
+        "filesize": int(install_properties.get("filesize", "0"), 16),
+        "pe_image": install_properties.get("peimagetype"),
+        "product_version": install_properties.get("productversion"),
+        "crc_checksum": install_properties.get("crcchecksum"),
+        "legal": install_properties.get("legalcopyright"),
+        "magic": install_properties.get("magic"),
+        "linker_version": install_properties.get("linkerversion"),
+        "product_name": install_properties.get("productname"),
+        "pe_subsystem": install_properties.get("pesubsystem"),
+        "longname": install_properties.get("longname"),
+        "pe_checksum": int(install_properties.get("pechecksum", "0x00"), 16),
+    }
+
+
+class AmcacheInstallPlugin(Plugin):
+    """Amcache install log plugin."""
+
+    def __init__(self, target: Target):
+        super().__init__(target)
+        self.logs = self.target.resolve("%windir%/appcompat/programs/install")
+
+    def check_compatible(self) -> None:
+        if not self.logs.exists():
+            raise UnsupportedPluginError("No amcache install logs found")
+
+    @export(record=[AmcacheArpCreateRecord, AmcacheFileCreateRecord])
+    def amcache_install(self) -> Iterator[AmcacheArpCreateRecord, AmcacheFileCreateRecord]:
+        """Return the contents of the Amcache install log.
+
+        The log file contains the changes an installer performed on the system.
+        These only get created when the executable is an installer.
+        """
+        for f in self.logs.iterdir():
+            install_properties = {}
+            arp_created = []
+            file_created = []
+            # Decode line by line instead of reading the whole file into one big str first.
+            with f.open("rb") as fh, io.TextIOWrapper(fh, encoding="utf-16-le") as lines:
+                for line in lines:
+                    # Lines are simple key=value pairs, a single partition is much cheaper
+                    # than running a regex over every line.
+                    key, sep, value = line.rstrip().partition("=")
+                    if not sep or not value:
+                        continue
+
+                    if key == "FileCreate":
+                        file_created.append(value)
+
+                    elif key == "ArpCreate":
+                        arp_created.append(value)
+
+                    else:
+                        install_properties[key.lower()] = value
+
+            # The install properties are invariant for all records of this log file,
+            # so parse them into record kwargs once instead of once per record.
+            base_kwargs = create_base_kwargs(install_properties)
+            base_kwargs["path"] = self.target.fs.path(path) if (path := install_properties.get("path")) else None
+            base_kwargs["filename"] = self.target.fs.path(str(f))
+            for arp_create in arp_created:
+                yield AmcacheArpCreateRecord(
+                    create=self.target.fs.path(arp_create),
+                    _target=self.target,
+                    **base_kwargs,
+                )
+            for file_create in file_created:
+                yield AmcacheFileCreateRecord(
+                    create=self.target.fs.path(file_create),
+                    _target=self.target,
+                    **base_kwargs,
+                )
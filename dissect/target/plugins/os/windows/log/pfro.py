@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import datetime
+import re
+from typing import TYPE_CHECKING
+
+from dissect.target.exceptions import UnsupportedPluginError
+from dissect.target.helpers.record import TargetRecordDescriptor
+from dissect.target.plugin import Plugin, export
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from dissect.target.target import Target
+
+RE_LOG_ERROR_PREFIX = re.compile(r".+[A-Za-z]")
+
+PfroRecord = TargetRecordDescriptor(
+    "filesystem/windows/pfro",
+    [
+        ("datetime", "ts"),
+        ("path", "path"),
+        ("string", "operation"),
+    ],
+)
+
+
+class PfroPlugin(Plugin):
+    """PFRO plugin."""
+
+    def __init__(self, target: Target):
+        super().__init__(target)
+        self.logfile = self.target.resolve("%windir%/PFRO.log")
+
+    def check_compatible(self) -> None:
+        if not self.logfile.exists():
+            raise UnsupportedPluginError("No PFRO log found")
+
+    @export(record=PfroRecord)
+    def pfro(self) -> Iterator[PfroRecord]:
+        """Return the content of %windir%/PFRO.log.
+
+        A Pending File Rename Operation log file (PFRO.log) holds information about the process of deleting or renaming
+        files that are locked or being used and that will be renamed on reboot. This is related to the filerenameop
+        plugin.
+
+        References:
+            - https://social.technet.microsoft.com/Forums/en-US/9b66a7b0-16d5-4d22-be4e-51df12db9f80/issue-understanding-pfro-log
+            - https://community.ccleaner.com/topic/49106-pending-file-rename-operations-log/
+
+        Yields PfroRecords with fields:
+
+        .. code-block:: text
+
+            hostname (string): The target hostname.
+            domain (string): The target domain.
+            ts (datetime): The parsed timestamp.
+            path (uri): The parsed path.
+            operation (string): The parsed operation.
+        """
+        target_tz = self.target.datetime.tzinfo
+
+        try:
+            for line in self.logfile.open("rt", encoding="utf-16-le"):
+                if len(line) <= 1:
+                    continue
+
+                # Walk the line left to right with partition, each separator is located in a
+                # single scan of the remainder instead of re-splitting the whole line.
+                date, _, rest = line.partition(" - ")
+                if "Error" in date:
+                    # prfo log can log its own error. This results in an entry
+                    # which gets grouped with the datetime of the logged
+                    # action.
+                    date = RE_LOG_ERROR_PREFIX.split(date, 1)[1]
+                file_info, sep, operation_info = rest.partition("|")
+                file_path = file_info[16:-2]
+                operation = operation_info.partition(" ")[0] if sep else None
+
+                # Example: 10/1/2021 7:19:59
+                # Constructing the datetime directly is considerably faster than strptime.
+                date_str, _, time_str = date.partition(" ")
+                month, day, year = date_str.split("/")
+                hour, minute, second = time_str.split(":")
+
+                yield PfroRecord(
+                    ts=datetime.datetime(
+                        int(year), int(month), int(day), int(hour), int(minute), int(second), tzinfo=target_tz
+                    ),
+                    path=self.target.fs.path(file_path),
+                    operation=operation,
+                    _target=self.target,
+                )
+        except UnicodeDecodeError:
+            pass
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import datetime
+import io
+from typing import TYPE_CHECKING
+
+from defusedxml import ElementTree
+
+try:
+    from lxml import etree
+
+    HAS_LXML = True
+
+except ImportError:
+    HAS_LXML = False
+
+from dissect.target.exceptions import UnsupportedPluginError
+from dissect.target.helpers.record import TargetRecordDescriptor
+from dissect.target.plugin import Plugin, export
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from dissect.target.target import Target
+
+# Example startupinfo entry:
+#
+#    <Process Name="C:\Windows\System32\SecurityHealthSystray.exe" PID="6208" StartedInTraceSec="48.500">
+#    	<StartTime>2020/09/11:18:12:48.6685573</StartTime>
+#    	<CommandLine><![CDATA["C:\Windows\System32\SecurityHealthSystray.exe" ]]></CommandLine>
+#    	<DiskUsage Units="bytes">325120</DiskUsage>
+#    	<CpuUsage Units="us">32024</CpuUsage>
+#    	<ParentPID>6016</ParentPID>
+#    	<ParentStartTime>2020/09/11:18:12:30.2666535</ParentStartTime>
+#    	<ParentName>explorer.exe</ParentName>
+#    </Process>
+
+StartupInfoRecord = TargetRecordDescriptor(
+    "filesystem/windows/startupinfo",
+    [
+        ("datetime", "ts"),
+        ("path", "path"),
+        ("path", "commandline"),
+        ("varint", "pid"),
+        ("varint", "parent_pid"),
+        ("datetime", "parent_start_time"),
+        ("path", "parent_name"),
+        ("varint", "disk_usage"),
+        ("varint", "cpu_usage"),
+    ],
+)
+
+
+def parse_ts(time_string: str) -> datetime.datetime | None:
+    if not time_string:
+        return None
+
+    # Example: 2020/09/11:18:12:48.6685573
+    # The field positions are fixed, so constructing the datetime from slices directly is
+    # considerably faster than strptime.
+    return datetime.datetime(
+        int(time_string[0:4]),
+        int(time_string[5:7]),
+        int(time_string[8:10]),
+        int(time_string[11:13]),
+        int(time_string[14:16]),
+        int(time_string[17:19]),
+        int(time_string[20:26].ljust(6, "0")),
+        tzinfo=datetime.timezone.utc,
+    )
+
+
+class StartupInfoPlugin(Plugin):
+    """Windows startup info plugin."""
+
+    def __init__(self, target: Target):
+        super().__init__(target)
+        self._dir = target.resolve("%windir%/system32/wdi/logfiles/startupinfo")
+
+    def check_compatible(self) -> None:
+        # Only probe for the first entry, listing the directory eagerly would walk it
+        # again when startupinfo() runs.
+        if not self._dir.exists() or next(self._dir.iterdir(), None) is None:
+            raise UnsupportedPluginError("No StartupInfo files found")
+
+    @export(record=StartupInfoRecord)
+    def startupinfo(self) -> Iterator[StartupInfoRecord]:
+        """Return the contents of StartupInfo files.
+
+        On a Windows system, the StartupInfo log files contain information about process execution for the first 90
+        seconds of user logon activity, such as process name and CPU usage.
+
+        References:
+            - https://www.trustedsec.com/blog/who-left-the-backdoor-open-using-startupinfo-for-the-win/
+        """
+        if not self._dir.exists():
+            return
+
+        for path in self._dir.iterdir():
+            fh = path.open("rb")
+
+            try:
+                if HAS_LXML:
+                    # Stream completed <Process> elements straight from the utf-16 bytes with the
+                    # libxml2 backend. Entity resolution and network access are disabled to match
+                    # the defusedxml hardening.
+                    processes = (
+                        element
+                        for _, element in etree.iterparse(
+                            fh, tag="Process", encoding="UTF-16LE", resolve_entities=False, no_network=True
+                        )
+                    )
+                else:
+                    # Decode incrementally while parsing instead of materializing the whole file
+                    # as bytes plus a second str copy.
+                    root = ElementTree.parse(io.TextIOWrapper(fh, encoding="utf-16-le"), forbid_dtd=True).getroot()
+                    processes = root.iter("Process")
+
+                for process in processes:
+                    start_time = process.findtext("StartTime")
+                    parent_start_time = process.findtext("ParentStartTime")
+
+                    yield StartupInfoRecord(
+                        ts=parse_ts(start_time),
+                        path=self.target.fs.path(process.get("Name")),
+                        commandline=self.target.fs.path(process.findtext("CommandLine")),
+                        pid=process.get("PID"),
+                        parent_pid=process.findtext("ParentPID"),
+                        parent_start_time=parse_ts(parent_start_time),
+                        parent_name=self.target.fs.path(process.findtext("ParentName")),
+                        disk_usage=process.findtext("DiskUsage"),
+                        cpu_usage=process.findtext("CpuUsage"),
+                        _target=self.target,
+                    )
+
+                    if HAS_LXML:
+                        # Drop the parsed subtree to bound memory usage.
+                        process.clear()
+            except Exception:
+                self.target.log.exception("Failed to open StartupInfo file: %s", str(path))
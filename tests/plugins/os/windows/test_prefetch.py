@@ -1,56 +1,74 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from io import BytesIO
 from unittest.mock import Mock, patch
 
 import pytest
 
 import dissect.target.plugins.os.windows.prefetch as prefetch
 
-if TYPE_CHECKING:
-    from collections.abc import Iterator
 
-    from dissect.cstruct import cstruct
+def build_prefetch(version: int, filenames: list[str], last_run_time: int = 0x01D7A0F9) -> bytes:
+    """Build a minimal synthetic prefetch file for the given version."""
+    file_info_struct, metric_struct = prefetch.prefetch_version_structs[version]
 
+    strings = b""
+    metrics = b""
+    for filename in filenames:
+        encoded = filename.encode("utf-16-le")
+        metrics += metric_struct(
+            filename_string_offset=len(strings),
+            filename_string_number_of_characters=len(encoded) // 2,
+        ).dumps()
+        strings += encoded + b"\x00\x00"
 
-@pytest.fixture
-def mocked_cstruct(version: int) -> Iterator[cstruct]:
-    with patch.object(prefetch, "c_prefetch") as mocked_cstruct:
-        mocked_cstruct.PREFETCH_HEADER.return_value.version = version
-        yield mocked_cstruct
+    header = prefetch.c_prefetch.PREFETCH_HEADER(
+        version=version,
+        signature=b"SCCA",
+        name="TEST.EXE\x00".encode("utf-16-le").ljust(60, b"\x00"),
+    )
+
+    metrics_offset = len(header.dumps()) + len(file_info_struct)
+    file_info = file_info_struct(
+        metrics_array_offset=metrics_offset,
+        number_of_file_metrics_entries=len(filenames),
+        filename_strings_offset=metrics_offset + len(metrics),
+        filename_strings_size=len(strings),
+        last_run_time=last_run_time,
+        run_count=1,
+    )
+
+    return header.dumps() + file_info.dumps() + metrics + strings
 
 
 @pytest.fixture
 def mocked_prefetch() -> prefetch.Prefetch:
-    with patch.object(prefetch, "c_prefetch"), patch.multiple(prefetch.Prefetch, identify=Mock(), parse=Mock()):
-        return prefetch.Prefetch(Mock())
+    with patch.multiple(prefetch.Prefetch, identify=Mock(), parse=Mock()):
+        return prefetch.Prefetch(BytesIO(bytes(len(prefetch.c_prefetch.PREFETCH_HEADER))))
 
 
 @pytest.mark.parametrize(
-    ("version", "dict_output"),
+    ("version", "file_info_name"),
     [
-        (17, ("FILE_INFORMATION_17", "FILE_METRICS_ARRAY_ENTRY_17")),
-        (23, ("FILE_INFORMATION_23", "FILE_METRICS_ARRAY_ENTRY_23")),
-        (30, ("FILE_INFORMATION_26", "FILE_METRICS_ARRAY_ENTRY_23")),
-        (31, ("FILE_INFORMATION_26", "FILE_METRICS_ARRAY_ENTRY_23")),
+        (17, "FILE_INFORMATION_17"),
+        (23, "FILE_INFORMATION_23"),
+        (30, "FILE_INFORMATION_26"),
+        (31, "FILE_INFORMATION_26"),
     ],
 )
-def test_prefetch_valid_versions(mocked_cstruct: cstruct, version: int, dict_output: tuple[str, str]) -> None:
-    file_info = getattr(mocked_cstruct, dict_output[0])
-    metric_array = getattr(mocked_cstruct, dict_output[1])
-    with (
-        patch.dict(prefetch.prefetch_version_structs, {version: (file_info, metric_array)}),
-        patch.object(prefetch.Prefetch, "parse_metrics") as mocked_metric,
-    ):
-        prefetch_obj = prefetch.Prefetch(Mock())
-        assert prefetch_obj.fn == file_info.return_value
-        mocked_metric.assert_called_with(metric_array_struct=metric_array)
-
-
-@pytest.mark.parametrize("version", [0xDEADBEEF])
-def test_prefetch_invalid_version(mocked_cstruct: cstruct) -> None:
+def test_prefetch_valid_versions(version: int, file_info_name: str) -> None:
+    filenames = ["\\DEVICE\\HARDDISKVOLUME1\\WINDOWS\\SYSTEM32\\NTDLL.DLL", "\\DEVICE\\HARDDISKVOLUME1\\TEST.EXE"]
+    prefetch_obj = prefetch.Prefetch(BytesIO(build_prefetch(version, filenames)))
+
+    assert prefetch_obj.version == version
+    assert type(prefetch_obj.fn).__name__ == file_info_name
+    assert prefetch_obj.fn.run_count == 1
+    assert prefetch_obj.metrics == filenames
+
+
+def test_prefetch_invalid_version() -> None:
     with pytest.raises(NotImplementedError):
-        prefetch.Prefetch(Mock())
+        prefetch.Prefetch(BytesIO(build_prefetch(23, []).replace(b"\x17\x00\x00\x00", b"\xef\xbe\xad\xde", 1)))
 
 
 def test_prefetch_datetime(mocked_prefetch: prefetch.Prefetch) -> None:
@@ -82,26 +100,16 @@ def test_prefetch_last_run_dates(mocked_prefetch: prefetch.Prefetch, dates: list
     assert len(mocked_prefetch.previous_timestamps) == expected_length
 
 
-def test_prefetch_parse_metrics(mocked_prefetch: prefetch.Prefetch) -> None:
-    mocked_prefetch.fh = Mock()
-    mocked_prefetch.fn = Mock()
-    mocked_prefetch.fn.number_of_file_metrics_entries = 10
-    with patch.object(prefetch.Prefetch, "read_filename") as filename:
-        filename.return_value.decode.return_value = ""
-        metric_struct = Mock()
-        mocked_prefetch.fn.filename_strings_offset = ""
-        metric_struct.return_value.filename_string_offset = ""
-        test = mocked_prefetch.parse_metrics(metric_array_struct=metric_struct)
-        assert len(test) == 10
-
-
-def test_prefetch_read_filename(mocked_prefetch: prefetch.Prefetch) -> None:
-    mocked_fileheader = Mock()
-    mocked_fileheader.read.return_value = b""
-
-    mocked_prefetch.fh = mocked_fileheader
-    filename = mocked_prefetch.read_filename(0x10, 0x10)
-
-    mocked_fileheader.read.assert_called_with(0x10 * 2)
-    assert isinstance(filename, bytes)
-    assert mocked_fileheader.seek.call_count == 2
+def test_prefetch_parse_metrics() -> None:
+    filenames = [f"\\DEVICE\\HARDDISKVOLUME1\\FILE{i}.DLL" for i in range(10)]
+    prefetch_obj = prefetch.Prefetch(BytesIO(build_prefetch(23, filenames)))
+
+    assert prefetch_obj.metrics == filenames
+
+
+def test_prefetch_parse_metrics_non_bmp() -> None:
+    # Non-BMP characters take two utf-16 code units, entries after them should stay aligned.
+    filenames = ["\\DEVICE\\HARDDISKVOLUME1\\\U0001f680.EXE", "\\DEVICE\\HARDDISKVOLUME1\\NTDLL.DLL"]
+    prefetch_obj = prefetch.Prefetch(BytesIO(build_prefetch(23, filenames)))
+
+    assert prefetch_obj.metrics == filenames